@@ -15,18 +15,36 @@ the sequence performed by the test.
 These tests should be used as a guide for implementing one's own state machine on top of YASMI.
 """
 
+import asyncio
 import logging
 import unittest
-import asyncio
-from typing import Tuple
+from typing import Awaitable, Tuple, Type
 
 import yasmi
-from testing_support import async_test, Mock, plantuml_logging, plantuml_logger
+from testing_support import (
+    DEBUG, async_test, compile_patch_plan, Mock, patch_actions, plantuml_logging, plantuml_logger
+)
 
-logging.basicConfig(level=logging.DEBUG, format='%(name)s - %(message)s')
+logging.basicConfig(level=logging.DEBUG if DEBUG else logging.WARNING, format='%(name)s - %(message)s')
 logger = logging.getLogger("TestYASMI")
 
 
+# MARK: Basic states
+# Empty states shared by the test state machines - their class names are what `active_state_types` reports.
+def _state_class(name: str) -> Type[yasmi.State]:
+    """Creates a basic, empty state class of the given name."""
+    return type(name, (yasmi.State,), {"__doc__": "A basic, empty state."})
+
+
+NewState = _state_class("NewState")
+NewState1 = _state_class("NewState1")
+NewState2 = _state_class("NewState2")
+NewState3 = _state_class("NewState3")
+NewState4 = _state_class("NewState4")
+NewState5 = _state_class("NewState5")
+NewState6 = _state_class("NewState6")
+
+
 # MARK: TestStateMachine1
 class TestStateMachine1(unittest.TestCase):
     """Tests the simplest state machine.
@@ -34,29 +52,26 @@ class TestStateMachine1(unittest.TestCase):
     This is the simplest state machine, with a single state.
     """
 
-    class NewState(yasmi.State):
-        """A basic, empty state."""
-
     class NewStateMachine(yasmi.StateMachine):
         """A state machine containing a single state."""
 
+        _TRANSITIONS = (
+            ("_initial", "_initial_transitions"),
+        )
+
         def __init__(self) -> None:
             """Instantiates the single state."""
             super().__init__()
-            self._state_1 = self._create_child(TestStateMachine1.NewState)
+            self._state_1 = self._create_child(NewState)
 
-            self._set_transitions_per_state(
-                {
-                    self._initial: self._initial_transitions,
-                }
-            )
+            self._set_transitions_per_state()
 
         async def dummy_action(self) -> None:
             """Dummy action for executing during a transition."""
 
-        async def _initial_transitions(self) -> None:
+        def _initial_transitions(self) -> Awaitable[None]:
             """Transition from the initial state to the New State."""
-            await self._transition_to(self._state_1, self.dummy_action)
+            return self._transition_to(self._state_1, self.dummy_action)
 
     @async_test
     @plantuml_logging
@@ -66,21 +81,123 @@ class TestStateMachine1(unittest.TestCase):
 
         # Run the test
         await state_machine.start()
-        self.assertEqual(state_machine.active_state_types, ["NewState"])
-        state_machine_mock.assert_called_once("async_dummy_action")
-        state_machine_mock.assert_called_once("async_entry_actions")
-        state_machine_mock.assert_called_once("async_do_actions")
+        self.assertEqual(state_machine.active_state_types, ("NewState",))
+        self.assertEqual(
+            state_machine_mock.called_once_names(),
+            {
+                "async_dummy_action",
+                "async_entry_actions",
+                "async_do_actions",
+            },
+        )
+        state_machine_mock.reset_calls()
         await state_machine.stop_ticker()
 
+    _MOCKED_ACTIONS = compile_patch_plan(
+        {
+            "dummy_action": "async_dummy_action",
+            "_state_1.entry_actions": "async_entry_actions",
+            "_state_1.do_actions": "async_do_actions",
+            "_state_1.exit_actions": "async_exit_actions",
+        }
+    )
+
     def _setup(self) -> Tuple[NewStateMachine, Mock]:
         state_machine = self.NewStateMachine()
         state_machine_mock = Mock()
-        state_machine.dummy_action = state_machine_mock.async_dummy_action
-        state_machine._state_1.entry_actions = state_machine_mock.async_entry_actions
-        state_machine._state_1.do_actions = state_machine_mock.async_do_actions
-        state_machine._state_1.exit_actions = state_machine_mock.async_exit_actions
+        patch_actions(state_machine, state_machine_mock, self._MOCKED_ACTIONS)
         return state_machine, state_machine_mock
 
+    class DoState(yasmi.State):
+        """A state that overrides `do()` itself, rather than `do_actions()`."""
+
+        def __init__(self, super_state: yasmi.CompositeState) -> None:
+            super().__init__(super_state)
+            self.do_count = 0
+
+        async def do(self) -> None:
+            self.do_count += 1
+
+    class DoStateMachine(yasmi.StateMachine):
+        """A state machine containing a single state that overrides `do()`."""
+
+        _TRANSITIONS = (
+            ("_initial", "_initial_transitions"),
+        )
+
+        def __init__(self) -> None:
+            """Instantiates the single state."""
+            super().__init__()
+            self._state_1 = self._create_child(TestStateMachine1.DoState)
+
+            self._set_transitions_per_state()
+
+        def _initial_transitions(self) -> Awaitable[None]:
+            """Transition from the initial state to the Do State."""
+            return self._transition_to(self._state_1)
+
+    @async_test
+    async def test_overridden_do(self) -> None:
+        """Tests that a state overriding `do()`, with no `do_actions()`, is still ticked."""
+        state_machine = self.DoStateMachine()
+
+        await state_machine.start()
+        self.assertEqual(state_machine._state_1.do_count, 1)
+
+        await state_machine.trigger_tick()
+        self.assertEqual(state_machine._state_1.do_count, 2)
+
+        await state_machine.stop_ticker()
+
+    @async_test
+    async def test_tick_raising_with_tick_pending(self) -> None:
+        """Tests that a tick raising, with another tick already requested, surfaces rather than hangs `settle()`."""
+        state_machine = self.NewStateMachine()
+        event = yasmi.Event(state_machine)
+
+        async def do_actions() -> None:
+            event.set_nowait()
+            raise RuntimeError("do actions")
+
+        state_machine.install_test_hooks({("_state_1", "do_actions"): do_actions})
+
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(state_machine.start(), 1)
+
+        assert state_machine.ticker is not None
+        self.assertTrue(state_machine.ticker.done())
+
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(state_machine.settle(), 1)
+
+    @async_test
+    async def test_stop_ticker_cancelled(self) -> None:
+        """Tests that cancelling the caller of `stop_ticker()` propagates, even though the ticker stops cleanly."""
+        state_machine = self.NewStateMachine()
+        await state_machine.start()
+
+        stop_task = asyncio.create_task(state_machine.stop_ticker())
+        await asyncio.sleep(0)
+        stop_task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await stop_task
+
+        assert state_machine.ticker is not None
+        self.assertTrue(state_machine.ticker.done())
+
+    @async_test
+    async def test_settle_after_stop(self) -> None:
+        """Tests that `settle()` returns for an event set once the ticker has stopped, as nothing will process it."""
+        state_machine = self.NewStateMachine()
+        event = yasmi.Event(state_machine)
+
+        await state_machine.start()
+        await state_machine.stop_ticker()
+
+        event.set_nowait()
+        await asyncio.wait_for(state_machine.settle(), 1)
+
 
 # MARK: TestStateMachine2
 class TestStateMachine2(unittest.TestCase):
@@ -90,46 +207,43 @@ class TestStateMachine2(unittest.TestCase):
     and no entry action, do actions, exit actions or transition actions.
     """
 
-    class NewState(yasmi.State):
-        """A basic, empty state."""
-
     class NewCompositeState(yasmi.CompositeState):
+        _TRANSITIONS = (
+            ("_initial", "_initial_transitions"),
+        )
+
         def __init__(self, super_state: yasmi.CompositeState | None):
             """Instantiates the single sub-state."""
             super().__init__(super_state)
-            self._state_1 = self._create_child(TestStateMachine2.NewState)
+            self._state_1 = self._create_child(NewState)
 
-            self._set_transitions_per_state(
-                {
-                    self._initial: self._initial_transitions,
-                }
-            )
+            self._set_transitions_per_state()
 
         async def dummy_action(self) -> None:
             """Dummy action for executing during a transition."""
 
-        async def _initial_transitions(self) -> None:
+        def _initial_transitions(self) -> Awaitable[None]:
             """Transition from the initial state to New State."""
-            await self._transition_to(self._state_1, self.dummy_action)
+            return self._transition_to(self._state_1, self.dummy_action)
 
     class NewStateMachine(yasmi.StateMachine):
+        _TRANSITIONS = (
+            ("_initial", "_initial_transitions"),
+        )
+
         def __init__(self):
             """Instantiates the single composite state."""
             super().__init__()
             self._state_1 = self._create_child(TestStateMachine2.NewCompositeState)
 
-            self._set_transitions_per_state(
-                {
-                    self._initial: self._initial_transitions,
-                }
-            )
+            self._set_transitions_per_state()
 
         async def dummy_action(self) -> None:
             """Dummy action for executing during a transition."""
 
-        async def _initial_transitions(self) -> None:
+        def _initial_transitions(self) -> Awaitable[None]:
             """Transition from the initial state to New Composite State."""
-            await self._transition_to(self._state_1, self.dummy_action)
+            return self._transition_to(self._state_1, self.dummy_action)
 
     @async_test
     @plantuml_logging
@@ -142,27 +256,72 @@ class TestStateMachine2(unittest.TestCase):
 
         # Run the test
         await state_machine.start()
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState", "NewState"])
-        state_machine_mock.assert_called_once("async_dummy_action")
-        state_machine_mock.assert_called_once("async_entry_actions")
-        state_machine_mock.assert_called_once("async_do_actions")
-        state_machine_state_1_mock.assert_called_once("async_dummy_action")
-        state_machine_state_1_mock.assert_called_once("async_entry_actions")
-        state_machine_state_1_mock.assert_called_once("async_do_actions")
+        self.assertEqual(state_machine.active_state_types, ("NewCompositeState", "NewState"))
+        self.assertEqual(
+            state_machine_mock.called_once_names(),
+            {
+                "async_dummy_action",
+                "async_entry_actions",
+                "async_do_actions",
+            },
+        )
+        state_machine_mock.reset_calls()
+        self.assertEqual(
+            state_machine_state_1_mock.called_once_names(),
+            {
+                "async_dummy_action",
+                "async_entry_actions",
+                "async_do_actions",
+            },
+        )
+        state_machine_state_1_mock.reset_calls()
         await state_machine.stop_ticker()
 
+    @async_test
+    async def test_rename(self) -> None:
+        """Tests that renaming states updates their `str()` and `hash()`, and those of a composite's pseudo-states."""
+        state_machine, _, _ = self._setup()
+        composite_state = state_machine._state_1
+
+        composite_state._state_1.name = "_RenamedState"
+        self.assertEqual(composite_state._state_1.name, "_RenamedState")
+        self.assertEqual(str(composite_state._state_1), "RenamedState")
+        self.assertEqual(hash(composite_state._state_1), hash("RenamedState"))
+
+        composite_state.name = "RenamedCompositeState"
+        self.assertEqual(str(composite_state), "RenamedCompositeState")
+        self.assertEqual(hash(composite_state), hash("RenamedCompositeState"))
+        self.assertEqual(str(composite_state._initial), "RenamedCompositeState_initial")
+        self.assertEqual(str(composite_state._final), "RenamedCompositeState_final")
+
+        await state_machine.start()
+        self.assertEqual(state_machine.active_state_types, ("RenamedCompositeState", "RenamedState"))
+        await state_machine.stop_ticker()
+
+    _MOCKED_ACTIONS = compile_patch_plan(
+        {
+            "dummy_action": "async_dummy_action",
+            "_state_1.entry_actions": "async_entry_actions",
+            "_state_1.do_actions": "async_do_actions",
+            "_state_1.exit_actions": "async_exit_actions",
+        }
+    )
+
+    _STATE_1_MOCKED_ACTIONS = compile_patch_plan(
+        {
+            "_state_1.dummy_action": "async_dummy_action",
+            "_state_1._state_1.entry_actions": "async_entry_actions",
+            "_state_1._state_1.do_actions": "async_do_actions",
+            "_state_1._state_1.exit_actions": "async_exit_actions",
+        }
+    )
+
     def _setup(self) -> Tuple[NewStateMachine, Mock, Mock]:
         state_machine = self.NewStateMachine()
         state_machine_mock = Mock()
-        state_machine.dummy_action = state_machine_mock.async_dummy_action
-        state_machine._state_1.entry_actions = state_machine_mock.async_entry_actions
-        state_machine._state_1.do_actions = state_machine_mock.async_do_actions
-        state_machine._state_1.exit_actions = state_machine_mock.async_exit_actions
+        patch_actions(state_machine, state_machine_mock, self._MOCKED_ACTIONS)
         state_machine_state_1_mock = Mock()
-        state_machine._state_1.dummy_action = state_machine_state_1_mock.async_dummy_action
-        state_machine._state_1._state_1.entry_actions = state_machine_state_1_mock.async_entry_actions
-        state_machine._state_1._state_1.do_actions = state_machine_state_1_mock.async_do_actions
-        state_machine._state_1._state_1.exit_actions = state_machine_state_1_mock.async_exit_actions
+        patch_actions(state_machine, state_machine_state_1_mock, self._STATE_1_MOCKED_ACTIONS)
         return state_machine, state_machine_mock, state_machine_state_1_mock
 
 
@@ -170,108 +329,9 @@ class TestStateMachine2(unittest.TestCase):
 class TestStateMachine3(unittest.TestCase):
     """Tests a simple state machine with two states.
 
-    This is a simple state machine with two states and transitions between them.
-    """
-
-
-    class NewState1(yasmi.State):
-        """A basic, empty state."""
-
-    class NewState2(yasmi.State):
-        """A basic, empty state."""
-
-    class NewStateMachine(yasmi.StateMachine):
-        """A new state machine with two sub-states."""
-
-        def __init__(self) -> None:
-            super().__init__()
-            plantuml_logger.debug("participant Events")
-            self.event = yasmi.Event(self)
-            self._state_1 = self._create_child(TestStateMachine3.NewState1)
-            self._state_2 = self._create_child(TestStateMachine3.NewState2)
-
-            self._set_transitions_per_state(
-                {
-                    self._initial: self._initial_transitions,
-                    self._state_1: self._state_1_transitions,
-                    self._state_2: self._state_2_transitions,
-                }
-            )
-
-        async def dummy_action_1(self) -> None:
-            """Dummy action for executing during a transition."""
-
-        async def dummy_action_2(self) -> None:
-            """Dummy action for executing during a transition."""
-
-        async def dummy_action_3(self) -> None:
-            """Dummy action for executing during a transition."""
-
-        async def _initial_transitions(self) -> None:
-            """Transition from the initial state to New Composite State."""
-            await self._transition_to(self._state_1, self.dummy_action_1)
-
-        async def _state_1_transitions(self) -> None:
-            """Transitions from New State 1 to New State 2."""
-            if self.event():
-                await self._transition_to(self._state_2, self.dummy_action_2)
-
-        async def _state_2_transitions(self) -> None:
-            """Transitions from New State 2 to New State 1."""
-            if self.event():
-                await self._transition_to(self._state_1, self.dummy_action_3)
-
-    @async_test
-    @plantuml_logging
-    async def test_state_machine_3(self) -> None:
-        """Executes the test scenario."""
-        state_machine, state_machine_mock = self._setup()
-
-        # Run the test
-        await state_machine.start()
-        self.assertEqual(state_machine.active_state_types, ["NewState1"])
-        state_machine_mock.assert_called_once("async_dummy_action_1")
-        state_machine_mock.assert_called_once("async_entry_actions_1")
-        state_machine_mock.assert_called_once("async_do_actions_1")
-
-        await state_machine.event.set()
-        self.assertEqual(state_machine.active_state_types, ["NewState2"])
-        state_machine_mock.assert_called_once("async_exit_actions_1")
-        state_machine_mock.assert_called_once("async_dummy_action_2")
-        state_machine_mock.assert_called_once("async_entry_actions_2")
-        state_machine_mock.assert_called_once("async_do_actions_2")
-
-        state_machine_mock.reset_calls_for("async_entry_actions_1")
-        state_machine_mock.reset_calls_for("async_do_actions_1")
-        await state_machine.event.set()
-        self.assertEqual(state_machine.active_state_types, ["NewState1"])
-        state_machine_mock.assert_called_once("async_exit_actions_2")
-        state_machine_mock.assert_called_once("async_dummy_action_3")
-        state_machine_mock.assert_called_once("async_entry_actions_1")
-        state_machine_mock.assert_called_once("async_do_actions_1")
-
-        await state_machine.stop_ticker()
-
-    def _setup(self) -> Tuple[NewStateMachine, Mock]:
-        state_machine = self.NewStateMachine()
-        state_machine_mock = Mock()
-        state_machine.dummy_action_1 = state_machine_mock.async_dummy_action_1
-        state_machine.dummy_action_2 = state_machine_mock.async_dummy_action_2
-        state_machine.dummy_action_3 = state_machine_mock.async_dummy_action_3
-        state_machine._state_1.entry_actions = state_machine_mock.async_entry_actions_1
-        state_machine._state_1.do_actions = state_machine_mock.async_do_actions_1
-        state_machine._state_1.exit_actions = state_machine_mock.async_exit_actions_1
-        state_machine._state_2.entry_actions = state_machine_mock.async_entry_actions_2
-        state_machine._state_2.do_actions = state_machine_mock.async_do_actions_2
-        state_machine._state_2.exit_actions = state_machine_mock.async_exit_actions_2
-        return state_machine, state_machine_mock
-
-
-# MARK: TestStateMachine3a
-class TestStateMachine3a(unittest.TestCase):
-    """Tests a simple state machine with two states and custom actions.
-
-    This is the same as StateMachine3 but with the entry, do and exit actions customised.
+    This is a simple state machine with two states and transitions between them.  The scenario is run twice: once
+    with the entry, do and exit actions replaced outright ("basic") and once with them customised to call the
+    state's own functions ("custom").
     """
 
     class NewState1(yasmi.State):
@@ -315,20 +375,20 @@ class TestStateMachine3a(unittest.TestCase):
     class NewStateMachine(yasmi.StateMachine):
         """A new state machine with two sub-states."""
 
+        _TRANSITIONS = (
+            ("_initial", "_initial_transitions"),
+            ("_state_1", "_state_1_transitions"),
+            ("_state_2", "_state_2_transitions"),
+        )
+
         def __init__(self) -> None:
             super().__init__()
             plantuml_logger.debug("participant Events")
             self.event = yasmi.Event(self)
-            self._state_1 = self._create_child(TestStateMachine3a.NewState1)
-            self._state_2 = self._create_child(TestStateMachine3a.NewState2)
-
-            self._set_transitions_per_state(
-                {
-                    self._initial: self._initial_transitions,
-                    self._state_1: self._state_1_transitions,
-                    self._state_2: self._state_2_transitions,
-                }
-            )
+            self._state_1 = self._create_child(TestStateMachine3.NewState1)
+            self._state_2 = self._create_child(TestStateMachine3.NewState2)
+
+            self._set_transitions_per_state()
 
         async def dummy_action_1(self) -> None:
             """Dummy action for executing during a transition."""
@@ -339,9 +399,9 @@ class TestStateMachine3a(unittest.TestCase):
         async def dummy_action_3(self) -> None:
             """Dummy action for executing during a transition."""
 
-        async def _initial_transitions(self) -> None:
+        def _initial_transitions(self) -> Awaitable[None]:
             """Transition from the initial state to New Composite State."""
-            await self._transition_to(self._state_1, self.dummy_action_1)
+            return self._transition_to(self._state_1, self.dummy_action_1)
 
         async def _state_1_transitions(self) -> None:
             """Transitions from New State 1 to New State 2."""
@@ -355,48 +415,106 @@ class TestStateMachine3a(unittest.TestCase):
 
     @async_test
     @plantuml_logging
-    async def test_state_machine_3a(self) -> None:
-        """Executes the test scenario."""
-        state_machine, state_machine_mock = self._setup()
-
-        # Run the test
-        await state_machine.start()
-        self.assertEqual(state_machine.active_state_types, ["NewState1"])
-        state_machine_mock.assert_called_once("async_dummy_action_1")
-        state_machine_mock.assert_called_once("entry_function_1")
-        state_machine_mock.assert_called_once("do_function_1")
-
-        await state_machine.event.set()
-        self.assertEqual(state_machine.active_state_types, ["NewState2"])
-        state_machine_mock.assert_called_once("exit_function_1")
-        state_machine_mock.assert_called_once("async_dummy_action_2")
-        state_machine_mock.assert_called_once("entry_function_2")
-        state_machine_mock.assert_called_once("do_function_2")
-
-        state_machine_mock.reset_calls_for("entry_function_1")
-        state_machine_mock.reset_calls_for("do_function_1")
-        await state_machine.event.set()
-        self.assertEqual(state_machine.active_state_types, ["NewState1"])
-        state_machine_mock.assert_called_once("exit_function_2")
-        state_machine_mock.assert_called_once("async_dummy_action_3")
-        state_machine_mock.assert_called_once("entry_function_1")
-        state_machine_mock.assert_called_once("do_function_1")
-
-        await state_machine.stop_ticker()
-
-    def _setup(self) -> Tuple[NewStateMachine, Mock]:
-        state_machine = self.NewStateMachine()
+    async def test_state_machine_3(self) -> None:
+        """Executes the test scenario for each way of providing the state actions."""
         state_machine_mock = Mock()
-        state_machine.dummy_action_1 = state_machine_mock.async_dummy_action_1
-        state_machine.dummy_action_2 = state_machine_mock.async_dummy_action_2
-        state_machine.dummy_action_3 = state_machine_mock.async_dummy_action_3
-        state_machine._state_1._my_entry_function = state_machine_mock.entry_function_1
-        state_machine._state_1._my_do_function = state_machine_mock.do_function_1
-        state_machine._state_1._my_exit_function = state_machine_mock.exit_function_1
-        state_machine._state_2._my_entry_function = state_machine_mock.entry_function_2
-        state_machine._state_2._my_do_function = state_machine_mock.do_function_2
-        state_machine._state_2._my_exit_function = state_machine_mock.exit_function_2
-        return state_machine, state_machine_mock
+
+        for mode, plan in self._MOCKED_ACTIONS.items():
+            with self.subTest(mode=mode):
+                state_machine = self.NewStateMachine()
+                patch_actions(state_machine, state_machine_mock, plan)
+                entry_1, do_1, exit_1, entry_2, do_2, exit_2 = self._ACTION_NAMES[mode]
+
+                # Run the test
+                await state_machine.start()
+                self.assertEqual(state_machine.active_state_types, ("NewState1",))
+                self.assertEqual(
+                    state_machine_mock.called_once_names(),
+                    {
+                        "async_dummy_action_1",
+                        entry_1,
+                        do_1,
+                    },
+                )
+                state_machine_mock.reset_calls()
+
+                await state_machine.event.set()
+                self.assertEqual(state_machine.active_state_types, ("NewState2",))
+                self.assertEqual(
+                    state_machine_mock.called_once_names(),
+                    {
+                        exit_1,
+                        "async_dummy_action_2",
+                        entry_2,
+                        do_2,
+                    },
+                )
+                state_machine_mock.reset_calls()
+
+                await state_machine.event.set()
+                self.assertEqual(state_machine.active_state_types, ("NewState1",))
+                self.assertEqual(
+                    state_machine_mock.called_once_names(),
+                    {
+                        exit_2,
+                        "async_dummy_action_3",
+                        entry_1,
+                        do_1,
+                    },
+                )
+                state_machine_mock.reset_calls()
+
+                await state_machine.stop_ticker()
+                state_machine_mock.reset_calls()
+
+    _MOCKED_ACTIONS = {
+        "basic": compile_patch_plan(
+            {
+                "dummy_action_1": "async_dummy_action_1",
+                "dummy_action_2": "async_dummy_action_2",
+                "dummy_action_3": "async_dummy_action_3",
+                "_state_1.entry_actions": "async_entry_actions_1",
+                "_state_1.do_actions": "async_do_actions_1",
+                "_state_1.exit_actions": "async_exit_actions_1",
+                "_state_2.entry_actions": "async_entry_actions_2",
+                "_state_2.do_actions": "async_do_actions_2",
+                "_state_2.exit_actions": "async_exit_actions_2",
+            }
+        ),
+        "custom": compile_patch_plan(
+            {
+                "dummy_action_1": "async_dummy_action_1",
+                "dummy_action_2": "async_dummy_action_2",
+                "dummy_action_3": "async_dummy_action_3",
+                "_state_1._my_entry_function": "entry_function_1",
+                "_state_1._my_do_function": "do_function_1",
+                "_state_1._my_exit_function": "exit_function_1",
+                "_state_2._my_entry_function": "entry_function_2",
+                "_state_2._my_do_function": "do_function_2",
+                "_state_2._my_exit_function": "exit_function_2",
+            }
+        ),
+    }
+
+    _ACTION_NAMES = {
+        "basic": (
+            "async_entry_actions_1",
+            "async_do_actions_1",
+            "async_exit_actions_1",
+            "async_entry_actions_2",
+            "async_do_actions_2",
+            "async_exit_actions_2",
+        ),
+        "custom": (
+            "entry_function_1",
+            "do_function_1",
+            "exit_function_1",
+            "entry_function_2",
+            "do_function_2",
+            "exit_function_2",
+        ),
+    }
+    """The mocked entry, do and exit action names of New State 1 then New State 2, per mode."""
 
 
 # MARK: TestStateMachine4
@@ -410,39 +528,27 @@ class TestStateMachine4(unittest.TestCase):
       - Composite State 2 has a history state as well as two sub-states.
     """
 
-    class NewState1(yasmi.State):
-        """A basic, empty state."""
-
-    class NewState2(yasmi.State):
-        """A basic, empty state."""
-
-    class NewState3(yasmi.State):
-        """A basic, empty state."""
-
-    class NewState4(yasmi.State):
-        """A basic, empty state."""
-
     class NewCompositeState1(yasmi.CompositeState):
+        _TRANSITIONS = (
+            ("_initial", "_initial_transitions"),
+            ("_state_1", "_state_1_transitions"),
+            ("_state_2", "_state_2_transitions"),
+        )
+
         def __init__(self, super_state: yasmi.CompositeState | None, event: yasmi.Event):
             yasmi.CompositeState.__init__(self, super_state)
             self._event = event
-            self._state_1 = TestStateMachine4.NewState1(self)
-            self._state_2 = TestStateMachine4.NewState2(self)
-
-            self._set_transitions_per_state(
-                {
-                    self._initial: self._initial_transitions,
-                    self._state_1: self._state_1_transitions,
-                    self._state_2: self._state_2_transitions,
-                }
-            )
+            self._state_1 = NewState1(self)
+            self._state_2 = NewState2(self)
+
+            self._set_transitions_per_state()
 
         async def dummy_action_3(self) -> None:
             """Dummy action for executing during a transition."""
 
-        async def _initial_transitions(self) -> None:
+        def _initial_transitions(self) -> Awaitable[None]:
             """Transition from the initial state to New Composite State."""
-            await self._transition_to(self._state_1)
+            return self._transition_to(self._state_1)
 
         async def _state_1_transitions(self) -> None:
             """Transitions from New State 1 to New State 2."""
@@ -455,21 +561,21 @@ class TestStateMachine4(unittest.TestCase):
                 await self._transition_to(self._final)
 
     class NewCompositeState2(yasmi.CompositeState):
+        _TRANSITIONS = (
+            ("_initial", "_initial_transitions"),
+            ("_history", "_history_transitions"),
+            ("_state_1", "_state_1_transitions"),
+            ("_state_2", "_state_2_transitions"),
+        )
+
         def __init__(self, super_state: yasmi.CompositeState | None, event: yasmi.Event) -> None:
             yasmi.CompositeState.__init__(self, super_state, has_history=True)
             self._event = event
-            self._state_1 = TestStateMachine4.NewState3(self)
-            self._state_2 = TestStateMachine4.NewState4(self)
+            self._state_1 = NewState3(self)
+            self._state_2 = NewState4(self)
             assert self._history is not None
 
-            self._set_transitions_per_state(
-                {
-                    self._initial: self._initial_transitions,
-                    self._history: self._history_transitions,
-                    self._state_1: self._state_1_transitions,
-                    self._state_2: self._state_2_transitions,
-                }
-            )
+            self._set_transitions_per_state()
 
         async def dummy_action_4(self) -> None:
             """Dummy action for executing during a transition."""
@@ -480,13 +586,13 @@ class TestStateMachine4(unittest.TestCase):
         async def dummy_action_6(self) -> None:
             """Dummy action for executing during a transition."""
 
-        async def _initial_transitions(self) -> None:
+        def _initial_transitions(self) -> Awaitable[None]:
             """Transition from the initial state to New Composite State."""
-            await self._transition_to(self._state_1, self.dummy_action_4)
+            return self._transition_to(self._state_1, self.dummy_action_4)
 
-        async def _history_transitions(self) -> None:
+        def _history_transitions(self) -> Awaitable[None]:
             """Transition from the initial state to New Composite State."""
-            await self._handle_history()
+            return self._handle_history()
 
         async def _state_1_transitions(self) -> None:
             """Transitions from New State 3 to New State 4."""
@@ -501,6 +607,12 @@ class TestStateMachine4(unittest.TestCase):
     class NewStateMachine(yasmi.StateMachine):
         """A state machine with two composite states, with the second one having a history state."""
 
+        _TRANSITIONS = (
+            ("_initial", "_initial_transitions"),
+            ("_state_1", "_state_1_transitions"),
+            ("_state_2", "_state_2_transitions"),
+        )
+
         def __init__(self) -> None:
             """Creates both sub composite states and the transition event."""
             super().__init__()
@@ -510,13 +622,7 @@ class TestStateMachine4(unittest.TestCase):
             self._state_1 = TestStateMachine4.NewCompositeState1(self, self.event_1)
             self._state_2 = TestStateMachine4.NewCompositeState2(self, self.event_1)
 
-            self._set_transitions_per_state(
-                {
-                    self._initial: self._initial_transitions,
-                    self._state_1: self._state_1_transitions,
-                    self._state_2: self._state_2_transitions,
-                }
-            )
+            self._set_transitions_per_state()
 
         async def dummy_action_1(self) -> None:
             """Dummy action for executing during a transition."""
@@ -524,9 +630,9 @@ class TestStateMachine4(unittest.TestCase):
         async def dummy_action_2(self) -> None:
             """Dummy action for executing during a transition."""
 
-        async def _initial_transitions(self) -> None:
+        def _initial_transitions(self) -> Awaitable[None]:
             """Transition from the initial state to New Composite State."""
-            await self._transition_to(self._state_1)
+            return self._transition_to(self._state_1)
 
         async def _state_1_transitions(self) -> None:
             """Transitions from New State 1 to New State 2."""
@@ -577,87 +683,131 @@ class TestStateMachine4(unittest.TestCase):
 
         # Run the test
         await state_machine.start()
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState1", "NewState1"])
-        state_machine_mock.assert_called_once("async_entry_actions_1")
-        state_machine_mock.assert_called_once("async_do_actions_1")
-        state_machine_mock.assert_called_once("async_entry_actions_11")
-        state_machine_mock.assert_called_once("async_do_actions_11")
+        self.assertEqual(state_machine.active_state_types, ("NewCompositeState1", "NewState1"))
+        self.assertEqual(
+            state_machine_mock.called_once_names(),
+            {
+                "async_entry_actions_1",
+                "async_do_actions_1",
+                "async_entry_actions_11",
+                "async_do_actions_11",
+            },
+        )
+        state_machine_mock.reset_calls()
 
         await state_machine.event_1.set()
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState1", "NewState2"])
-        state_machine_mock.assert_called_once("async_exit_actions_11")
-        state_machine_mock.assert_called_once("async_dummy_action_3")
-        state_machine_mock.assert_called_once("async_entry_actions_12")
-        state_machine_mock.assert_called_once("async_do_actions_12")
+        self.assertEqual(state_machine.active_state_types, ("NewCompositeState1", "NewState2"))
+        self.assertEqual(
+            state_machine_mock.called_once_names(),
+            {
+                "async_do_actions_1",
+                "async_exit_actions_11",
+                "async_dummy_action_3",
+                "async_entry_actions_12",
+                "async_do_actions_12",
+            },
+        )
+        state_machine_mock.reset_calls()
 
         await state_machine.event_1.set()
-        await asyncio.sleep(0)  # need this extra yield to complete the transition from the 'final' state
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState2", "NewState3"])
-        state_machine_mock.assert_called_once("async_exit_actions_12")
-        state_machine_mock.assert_called_once("async_exit_actions_1")
-        state_machine_mock.assert_called_once("async_dummy_action_1")
-        state_machine_mock.assert_called_once("async_entry_actions_2")
-        state_machine_mock.assert_called_once("async_do_actions_2")
-        state_machine_mock.assert_called_once("async_dummy_action_4")
-        state_machine_mock.assert_called_once("async_entry_actions_21")
-        state_machine_mock.assert_called_once("async_do_actions_21")
+        await state_machine.settle()  # complete the transition from the 'final' state
+        self.assertEqual(state_machine.active_state_types, ("NewCompositeState2", "NewState3"))
+        self.assertEqual(
+            state_machine_mock.called_once_names(),
+            {
+                "async_do_actions_1",
+                "async_exit_actions_12",
+                "async_exit_actions_1",
+                "async_dummy_action_1",
+                "async_entry_actions_2",
+                "async_do_actions_2",
+                "async_dummy_action_4",
+                "async_entry_actions_21",
+                "async_do_actions_21",
+            },
+        )
+        state_machine_mock.reset_calls()
 
         await state_machine.event_1.set()
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState2", "NewState4"])
-        state_machine_mock.assert_called_once("async_exit_actions_21")
-        state_machine_mock.assert_called_once("async_dummy_action_5")
-        state_machine_mock.assert_called_once("async_entry_actions_22")
-        state_machine_mock.assert_called_once("async_do_actions_22")
+        self.assertEqual(state_machine.active_state_types, ("NewCompositeState2", "NewState4"))
+        self.assertEqual(
+            state_machine_mock.called_once_names(),
+            {
+                "async_do_actions_2",
+                "async_exit_actions_21",
+                "async_dummy_action_5",
+                "async_entry_actions_22",
+                "async_do_actions_22",
+            },
+        )
+        state_machine_mock.reset_calls()
 
-        state_machine_mock.reset_calls_for("async_do_actions_1")
         await state_machine.event_2.set()
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState1", "NewState1"])
-        state_machine_mock.assert_called_once("async_exit_actions_22")
-        state_machine_mock.assert_called_once("async_exit_actions_2")
-        state_machine_mock.assert_called_once("async_dummy_action_2")
-        state_machine_mock.assert_called_once("async_entry_actions_1")
-        state_machine_mock.assert_called_once("async_do_actions_1")
-        state_machine_mock.assert_called_once("async_entry_actions_11")
-        state_machine_mock.assert_called_once("async_do_actions_11")
-
-        state_machine_mock.reset_calls_for("async_do_actions_2")
+        self.assertEqual(state_machine.active_state_types, ("NewCompositeState1", "NewState1"))
+        self.assertEqual(
+            state_machine_mock.called_once_names(),
+            {
+                "async_exit_actions_22",
+                "async_exit_actions_2",
+                "async_dummy_action_2",
+                "async_entry_actions_1",
+                "async_do_actions_1",
+                "async_entry_actions_11",
+                "async_do_actions_11",
+            },
+        )
+        state_machine_mock.reset_calls()
+
         await state_machine.event_2.set()
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState2", "NewState4"])
-        state_machine_mock.assert_called_once("async_exit_actions_1")
-        state_machine_mock.assert_called_once("async_entry_actions_2")
-        state_machine_mock.assert_called_with("async_do_actions_2")
-        state_machine_mock.assert_called_once("async_entry_actions_22")
-        state_machine_mock.assert_called_once("async_do_actions_22")
+        self.assertEqual(state_machine.active_state_types, ("NewCompositeState2", "NewState4"))
+        self.assertEqual(
+            state_machine_mock.called_once_names(),
+            {
+                "async_exit_actions_11",
+                "async_exit_actions_1",
+                "async_entry_actions_2",
+                "async_do_actions_2",
+                "async_entry_actions_22",
+                "async_do_actions_22",
+            },
+        )
+        state_machine_mock.reset_calls()
 
         await state_machine.stop_ticker()
 
+    _MOCKED_ACTIONS = compile_patch_plan(
+        {
+            "dummy_action_1": "async_dummy_action_1",
+            "dummy_action_2": "async_dummy_action_2",
+            "_state_1.dummy_action_3": "async_dummy_action_3",
+            "_state_2.dummy_action_4": "async_dummy_action_4",
+            "_state_2.dummy_action_5": "async_dummy_action_5",
+            "_state_2.dummy_action_6": "async_dummy_action_6",
+            "_state_1.entry_actions": "async_entry_actions_1",
+            "_state_1.do_actions": "async_do_actions_1",
+            "_state_1.exit_actions": "async_exit_actions_1",
+            "_state_2.entry_actions": "async_entry_actions_2",
+            "_state_2.do_actions": "async_do_actions_2",
+            "_state_2.exit_actions": "async_exit_actions_2",
+            "_state_1._state_1.entry_actions": "async_entry_actions_11",
+            "_state_1._state_1.do_actions": "async_do_actions_11",
+            "_state_1._state_1.exit_actions": "async_exit_actions_11",
+            "_state_1._state_2.entry_actions": "async_entry_actions_12",
+            "_state_1._state_2.do_actions": "async_do_actions_12",
+            "_state_1._state_2.exit_actions": "async_exit_actions_12",
+            "_state_2._state_1.entry_actions": "async_entry_actions_21",
+            "_state_2._state_1.do_actions": "async_do_actions_21",
+            "_state_2._state_1.exit_actions": "async_exit_actions_21",
+            "_state_2._state_2.entry_actions": "async_entry_actions_22",
+            "_state_2._state_2.do_actions": "async_do_actions_22",
+            "_state_2._state_2.exit_actions": "async_exit_actions_22",
+        }
+    )
+
     def _setup(self) -> Tuple[NewStateMachine, Mock]:
         state_machine = self.NewStateMachine()
         state_machine_mock = Mock()
-        state_machine.dummy_action_1 = state_machine_mock.async_dummy_action_1
-        state_machine.dummy_action_2 = state_machine_mock.async_dummy_action_2
-        state_machine._state_1.dummy_action_3 = state_machine_mock.async_dummy_action_3
-        state_machine._state_2.dummy_action_4 = state_machine_mock.async_dummy_action_4
-        state_machine._state_2.dummy_action_5 = state_machine_mock.async_dummy_action_5
-        state_machine._state_2.dummy_action_6 = state_machine_mock.async_dummy_action_6
-        state_machine._state_1.entry_actions = state_machine_mock.async_entry_actions_1
-        state_machine._state_1.do_actions = state_machine_mock.async_do_actions_1
-        state_machine._state_1.exit_actions = state_machine_mock.async_exit_actions_1
-        state_machine._state_2.entry_actions = state_machine_mock.async_entry_actions_2
-        state_machine._state_2.do_actions = state_machine_mock.async_do_actions_2
-        state_machine._state_2.exit_actions = state_machine_mock.async_exit_actions_2
-        state_machine._state_1._state_1.entry_actions = state_machine_mock.async_entry_actions_11
-        state_machine._state_1._state_1.do_actions = state_machine_mock.async_do_actions_11
-        state_machine._state_1._state_1.exit_actions = state_machine_mock.async_exit_actions_11
-        state_machine._state_1._state_2.entry_actions = state_machine_mock.async_entry_actions_12
-        state_machine._state_1._state_2.do_actions = state_machine_mock.async_do_actions_12
-        state_machine._state_1._state_2.exit_actions = state_machine_mock.async_exit_actions_12
-        state_machine._state_2._state_1.entry_actions = state_machine_mock.async_entry_actions_21
-        state_machine._state_2._state_1.do_actions = state_machine_mock.async_do_actions_21
-        state_machine._state_2._state_1.exit_actions = state_machine_mock.async_exit_actions_21
-        state_machine._state_2._state_2.entry_actions = state_machine_mock.async_entry_actions_22
-        state_machine._state_2._state_2.do_actions = state_machine_mock.async_do_actions_22
-        state_machine._state_2._state_2.exit_actions = state_machine_mock.async_exit_actions_22
+        patch_actions(state_machine, state_machine_mock, self._MOCKED_ACTIONS)
         return state_machine, state_machine_mock
 
 
@@ -671,93 +821,85 @@ class TestStateMachine5(unittest.TestCase):
       - Composite State 2 has a history state as well as two, concurrent regions, each with two sub-states.
     """
 
-    class NewState1(yasmi.State):
-        """A basic, empty state."""
-
-    class NewState2(yasmi.State):
-        """A basic, empty state."""
-
-    class NewState3(yasmi.State):
-        """A basic, empty state."""
-
-    class NewState4(yasmi.State):
-        """A basic, empty state."""
-
-    class NewState5(yasmi.State):
-        """A basic, empty state."""
-
-    class NewState6(yasmi.State):
-        """A basic, empty state."""
-
     class NewCompositeState1(yasmi.CompositeState):
+        _TRANSITIONS = (
+            ("_initial", "_initial_transitions"),
+            ("_state_1", "_state_1_transitions"),
+            ("_state_2", "_state_2_transitions"),
+        )
+
         def __init__(self, super_state: yasmi.CompositeState | None, event_1: yasmi.Event) -> None:
             yasmi.CompositeState.__init__(self, super_state)
-            self._event_1 = event_1
-            self._state_1 = TestStateMachine5.NewState1(self)
-            self._state_2 = TestStateMachine5.NewState2(self)
-
-            self._set_transitions_per_state(
-                {
-                    self._initial: self._initial_transitions,
-                    self._state_1: self._state_1_transitions,
-                    self._state_2: self._state_2_transitions,
-                }
-            )
+            self._state_1 = NewState1(self)
+            self._state_2 = NewState2(self)
 
-        async def _initial_transitions(self) -> None:
-            await self._transition_to(self._state_1)
+            # The transitions close over the event, rather than looking it up on `self` each tick
+            async def _state_1_transitions() -> None:
+                if event_1():
+                    await self._transition_to(self._state_2)
 
-        async def _state_1_transitions(self) -> None:
-            if self._event_1():
-                await self._transition_to(self._state_2)
+            async def _state_2_transitions() -> None:
+                if event_1():
+                    await self._transition_to(self._final)
 
-        async def _state_2_transitions(self) -> None:
-            if self._event_1():
-                await self._transition_to(self._final)
+            self._state_1_transitions = _state_1_transitions
+            self._state_2_transitions = _state_2_transitions
+            self._set_transitions_per_state()
+
+        def _initial_transitions(self) -> Awaitable[None]:
+            return self._transition_to(self._state_1)
 
     class NewCompositeState2(yasmi.ConcurrentCompositeState):
+        _TRANSITIONS = (
+            ("_initial", "_initial_transitions"),
+            ("_state_1", "_state_1_transitions"),
+            ("_state_2", "_state_2_transitions"),
+            ("_state_3", "_state_3_transitions"),
+            ("_state_4", "_state_4_transitions"),
+        )
+
         def __init__(self, super_state: yasmi.CompositeState | None, event_1: yasmi.Event, event_3: yasmi.Event) -> None:
             yasmi.ConcurrentCompositeState.__init__(self, 2, super_state)
-            self._event_1 = event_1
-            self._event_3 = event_3
-            self._state_1 = TestStateMachine5.NewState3(self)
-            self._state_2 = TestStateMachine5.NewState4(self)
-            self._state_3 = TestStateMachine5.NewState5(self)
-            self._state_4 = TestStateMachine5.NewState6(self)
-
-            self._set_transitions_per_state(
-                {
-                    self._initial: self._initial_transitions,
-                    self._state_1: self._state_1_transitions,
-                    self._state_2: self._state_2_transitions,
-                    self._state_3: self._state_3_transitions,
-                    self._state_4: self._state_4_transitions,
-                }
-            )
+            self._state_1 = NewState3(self)
+            self._state_2 = NewState4(self)
+            self._state_3 = NewState5(self)
+            self._state_4 = NewState6(self)
 
-        async def _initial_transitions(self) -> None:
-            await self._transition_to(self._state_1, 0)
-            await self._transition_to(self._state_3, 1)
+            # The transitions close over the events, rather than looking them up on `self` each tick
+            async def _state_1_transitions() -> None:
+                if event_1():
+                    await self._transition_to(self._state_2, 0)
 
-        async def _state_1_transitions(self) -> None:
-            if self._event_1():
-                await self._transition_to(self._state_2, 0)
+            async def _state_2_transitions() -> None:
+                if event_1():
+                    await self._transition_to(self._final, 0)
 
-        async def _state_2_transitions(self) -> None:
-            if self._event_1():
-                await self._transition_to(self._final, 0)
+            async def _state_3_transitions() -> None:
+                if event_3():
+                    await self._transition_to(self._state_4, 1)
 
-        async def _state_3_transitions(self) -> None:
-            if self._event_3():
-                await self._transition_to(self._state_4, 1)
+            async def _state_4_transitions() -> None:
+                if event_3():
+                    await self._transition_to(self._final, 1)
 
-        async def _state_4_transitions(self) -> None:
-            if self._event_3():
-                await self._transition_to(self._final, 1)
+            self._state_1_transitions = _state_1_transitions
+            self._state_2_transitions = _state_2_transitions
+            self._state_3_transitions = _state_3_transitions
+            self._state_4_transitions = _state_4_transitions
+            self._set_transitions_per_state()
+
+        def _initial_transitions(self) -> Awaitable[None]:
+            return self._transition_many_to((self._state_1, 0), (self._state_3, 1))
 
     class NewStateMachine(yasmi.StateMachine):
         """A state machine with two composite states, with the second one having a history state."""
 
+        _TRANSITIONS = (
+            ("_initial", "_initial_transitions"),
+            ("_state_1", "_state_1_transitions"),
+            ("_state_2", "_state_2_transitions"),
+        )
+
         def __init__(self) -> None:
             """Creates both sub composite states and the transition event."""
             yasmi.StateMachine.__init__(self)
@@ -767,19 +909,13 @@ class TestStateMachine5(unittest.TestCase):
             self._state_1 = TestStateMachine5.NewCompositeState1(self, self.event_1)
             self._state_2 = TestStateMachine5.NewCompositeState2(self, self.event_1, self.event_3)
 
-            self._set_transitions_per_state(
-                {
-                    self._initial: self._initial_transitions,
-                    self._state_1: self._state_1_transitions,
-                    self._state_2: self._state_2_transitions,
-                }
-            )
+            self._set_transitions_per_state()
 
         async def dummy_action(self) -> None:
             """Dummy action for executing during a transition."""
 
-        async def _initial_transitions(self) -> None:
-            await self._transition_to(self._state_1)
+        def _initial_transitions(self) -> Awaitable[None]:
+            return self._transition_to(self._state_1)
 
         async def _state_1_transitions(self) -> None:
             if self._state_1.is_at_final_state():
@@ -793,6 +929,14 @@ class TestStateMachine5(unittest.TestCase):
             if self.event_2():
                 await self._transition_to(self._state_1)
 
+    # The expected active state types at each step of the test
+    _IN_STATE_1_1 = ("NewCompositeState1", "NewState1")
+    _IN_STATE_1_2 = ("NewCompositeState1", "NewState2")
+    _IN_STATES_2_3_AND_2_5 = ("NewCompositeState2", ("NewState3", "NewState5"))
+    _IN_STATES_2_4_AND_2_5 = ("NewCompositeState2", ("NewState4", "NewState5"))
+    _IN_STATES_2_4_AND_2_6 = ("NewCompositeState2", ("NewState4", "NewState6"))
+    _IN_STATE_2_6 = ("NewCompositeState2", ("NewState6",))
+
     @async_test
     async def test_state_machine_5(self) -> None:
 #         """Tests a transition sequence through the state machine.
@@ -824,40 +968,92 @@ class TestStateMachine5(unittest.TestCase):
 
         # Run the test
         await state_machine.start()
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState1", "NewState1"])
+        self._assertStates(state_machine, self._IN_STATE_1_1)
 
         await state_machine.event_1.set()
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState1", "NewState2"])
+        self._assertStates(state_machine, self._IN_STATE_1_2)
 
         await state_machine.event_1.set()
-        await asyncio.sleep(0)
-        await asyncio.sleep(0)
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState2", ["NewState3", "NewState5"]])
+        await state_machine.settle()
+        self._assertStates(state_machine, self._IN_STATES_2_3_AND_2_5)
 
         await state_machine.event_1.set()
-        await asyncio.sleep(0)
-        await asyncio.sleep(0)
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState2", ["NewState4", "NewState5"]])
+        await state_machine.settle()
+        self._assertStates(state_machine, self._IN_STATES_2_4_AND_2_5)
 
         await state_machine.event_3.set()
-        await asyncio.sleep(0)
-        await asyncio.sleep(0)
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState2", ["NewState4", "NewState6"]])
+        await state_machine.settle()
+        self._assertStates(state_machine, self._IN_STATES_2_4_AND_2_6)
 
         await state_machine.event_1.set()
-        await asyncio.sleep(0)
-        await asyncio.sleep(0)
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState2", ["NewState6"]])
+        await state_machine.settle()
+        self._assertStates(state_machine, self._IN_STATE_2_6)
 
         await state_machine.event_3.set()
-        await state_machine.trigger_tick()  # needed to trigger detection of concurrent final state
-        await asyncio.sleep(0.1)
-        await state_machine.trigger_tick()  # trigger again to process the final state transition
-        await asyncio.sleep(0.1)
-        self.assertEqual(state_machine.active_state_types, ["NewCompositeState1", "NewState1"])
+        await state_machine.settle()  # reaching the concurrent final state triggers the transition out of it
+        self._assertStates(state_machine, self._IN_STATE_1_1)
+
+        await state_machine.stop_ticker()
+
+    @async_test
+    async def test_set_nowait(self) -> None:
+        """Tests that events set together with `set_nowait()`, which does not yield, are all processed on settling."""
+        state_machine = self._setup()
+
+        await state_machine.start()
+        await state_machine.event_1.set()
+        await state_machine.event_1.set()
+        await state_machine.settle()
+        self._assertStates(state_machine, self._IN_STATES_2_3_AND_2_5)
+
+        # One event for each of the concurrent regions
+        state_machine.event_1.set_nowait()
+        state_machine.event_3.set_nowait()
+        await state_machine.settle()
+        self._assertStates(state_machine, self._IN_STATES_2_4_AND_2_6)
+        self.assertFalse(state_machine.event_1())
+        self.assertFalse(state_machine.event_3())
 
         await state_machine.stop_ticker()
 
+    @async_test
+    async def test_transition_many_to(self) -> None:
+        """Tests transitions in both concurrent regions at once, with actions, including one that raises."""
+        state_machine = self._setup()
+        state_machine_mock = Mock()
+        composite_state = state_machine._state_2
+
+        await state_machine.start()
+        await state_machine.event_1.set()
+        await state_machine.event_1.set()
+        await state_machine.settle()
+        self._assertStates(state_machine, self._IN_STATES_2_3_AND_2_5)
+
+        await composite_state._transition_many_to(
+            (composite_state._state_2, 0, state_machine_mock.async_action_1),
+            (composite_state._state_4, 1, state_machine_mock.async_action_2),
+        )
+        self._assertStates(state_machine, self._IN_STATES_2_4_AND_2_6)
+        self.assertEqual(state_machine_mock.called_once_names(), {"async_action_1", "async_action_2"})
+
+        async def failing_action() -> None:
+            raise RuntimeError("transition action")
+
+        # The region whose transition completed is still recorded, despite the other raising
+        with self.assertRaises(RuntimeError):
+            await composite_state._transition_many_to(
+                (composite_state._state_1, 0, state_machine_mock.async_action_1),
+                (composite_state._state_3, 1, failing_action),
+            )
+        self.assertIs(composite_state._states[0], composite_state._state_1)
+
+        await state_machine.stop_ticker()
+
+    def _assertStates(self, state_machine: NewStateMachine, expected: Tuple[object, ...]) -> None:
+        """Asserts the state machine's active state types, comparing directly rather than via `assertEqual`."""
+        if state_machine.active_state_types != expected:
+            self.fail(f"{state_machine.active_state_types!r} != {expected!r}")
+
     def _setup(self) -> NewStateMachine:
         return self.NewStateMachine()
 
@@ -6,69 +6,154 @@
 
 import asyncio
 import logging
-from typing import Any, Callable, List, Tuple, Dict, Awaitable
+import os
+from typing import Any, Callable, Tuple, Awaitable
+
+DEBUG = os.getenv("YASMI_DEBUG") == "1"
+"""Whether to emit debug and PlantUML logging - set the `YASMI_DEBUG` environment variable to "1" to enable it."""
 
 plantuml_logger = logging.getLogger("PlantUML")
-plantuml_logger.setLevel(logging.INFO)
-plantuml_logger.setLevel(logging.DEBUG)
+plantuml_logger.setLevel(logging.DEBUG if DEBUG else logging.WARNING)
+_plantuml_debug = plantuml_logger.debug
 
 
 # Code based on https://stackoverflow.com/a/23036785/156169
 def async_test(f: Callable[..., Any]) -> Callable[..., None]:
     def wrapper(*args: Any, **kwargs: Any):
-        loop = asyncio.get_event_loop()
-        t = loop.create_task(f(*args, **kwargs))
-        loop.run_until_complete(t)
+        asyncio.run(f(*args, **kwargs))
     return wrapper
 
 
+class _Completed:
+    """An awaitable that has already completed with the given result.
+
+    Mocked `async_` methods return one of these rather than a coroutine, so awaiting them needs no coroutine frame.
+    """
+
+    def __init__(self, result: Any = None) -> None:
+        self._result = result
+
+    def __await__(self) -> Any:
+        if self._result is None:
+            return iter(())
+
+        return self._result_of()
+
+    __iter__ = __await__  # MicroPython drives awaitables through __iter__ rather than __await__
+
+    def _result_of(self) -> Any:
+        return self._result
+        yield  # unreachable, but makes this a generator that finishes at once, returning the result from the await
+
+
+_DONE = _Completed()
+
+
 class Mock:
     def __init__(self) -> None:
-        self._calls: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
-        self._return_values: Dict[str, Any] = {}
+        self._calls: dict[str, list[tuple[tuple[Any, ...], dict[str, Any]]]] = {}
+        self._return_values: dict[str, Any] = {}
 
     def __getattr__(self, name: str) -> Callable[..., Any]:
+        """Creates the named mock method, caching it so this is only called on first access."""
+        append = self._calls_to(name).append
+        return_value = self._return_values.get
+
         if name.startswith('async_'):
-            async def async_method(*args: Any, **kwargs: Any) -> Any:
-                self._calls.append((name, args, kwargs))
-                return self._return_values.get(name, None)
-            return async_method
+            def method(*args: Any, **kwargs: Any) -> Any:
+                append((args, kwargs))
+                result = return_value(name)
+                return _DONE if result is None else _Completed(result)
         else:
             def method(*args: Any, **kwargs: Any) -> Any:
-                self._calls.append((name, args, kwargs))
-                return self._return_values.get(name, None)
-            return method
+                append((args, kwargs))
+                return return_value(name)
+
+        setattr(self, name, method)
+        return method
+
+    def _calls_to(self, name: str) -> list[tuple[tuple[Any, ...], dict[str, Any]]]:
+        """Gets the recorded calls to the named method, allocating the list on first use."""
+        calls = self._calls.get(name)
+
+        if calls is None:
+            calls = self._calls[name] = []
+
+        return calls
 
     def set_return_value(self, name: str, value: Any) -> None:
         self._return_values[name] = value
 
     def assert_called_with(self, name: str, *args: Any, **kwargs: Any) -> None:
-        for call in self._calls:
-            if call[0] == name and call[1] == args and call[2] == kwargs:
-                return
+        if (args, kwargs) in self._calls.get(name, ()):
+            return
         raise AssertionError(f"Expected call not found: {name} with args {args} and kwargs {kwargs}")
 
     def assert_called_once(self, name: str, *args: Any, **kwargs: Any) -> None:
-        calls = [call for call in self._calls if call[0] == name and call[1] == args and call[2] == kwargs]
+        count = self._calls.get(name, ()).count((args, kwargs))
 
-        if len(calls) == 1:
+        if count == 1:
             self.reset_calls_for(name)
             return
 
         raise AssertionError(
             f"Expected {name} to be called once with args {args} and kwargs {kwargs}, "
-            f"but was called {len(calls)} times"
+            f"but was called {count} times"
         )
 
+    def called_once_names(self) -> set[str]:
+        return {name for name, calls in self._calls.items() if len(calls) == 1}
+
     def reset_calls_for(self, name: str) -> None:
-        self._calls = [call for call in self._calls if call[0] != name]
+        self._calls_to(name).clear()
+
+    def reset_calls(self) -> None:
+        for calls in self._calls.values():
+            calls.clear()
+
+
+# A runtime alias, so spelt with `typing.Tuple` as MicroPython's built-in types cannot be subscripted
+PatchPlan = Tuple[Tuple[Tuple[str, ...], str], ...]
+
+
+def compile_patch_plan(actions: dict[str, str]) -> PatchPlan:
+    """Splits the dotted attribute paths of a map of actions to patch, once, ahead of :py:func:`patch_actions`.
+
+    Args:
+        actions: a map of dotted attribute paths, relative to the state machine, to the name of the mock
+                 method to patch in
+
+    Returns:
+        a tuple of (attribute path, mock method name) per action
+    """
+    return tuple((tuple(path.split(".")), name) for path, name in actions.items())
+
+
+def patch_actions(state_machine: Any, mock: Mock, plan: PatchPlan) -> None:
+    """Replaces actions of `state_machine` with methods of `mock`, via :py:meth:`yasmi.StateMachine.install_test_hooks`.
+
+    Args:
+        state_machine: the state machine to patch
+        mock:          the mock providing the replacement methods
+        plan:          the actions to patch, as compiled by :py:func:`compile_patch_plan`
+    """
+    state_machine.install_test_hooks({path: getattr(mock, name) for path, name in plan})
 
 
 def plantuml_logging(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Brackets the PlantUML logging of a test with `@startuml` and `@enduml`, when PlantUML logging is enabled.
+
+    Otherwise `func` is returned unwrapped.
+    """
+    if not plantuml_logger.isEnabledFor(logging.DEBUG):
+        return func
+
+    start_message = f"\n@startuml {func.__name__}"
+
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
-        plantuml_logger.debug("\n@startuml %s", func.__name__)
+        _plantuml_debug(start_message)
         try:
             return await func(*args, **kwargs)
         finally:
-            plantuml_logger.debug("@enduml")
+            _plantuml_debug("@enduml")
     return wrapper
@@ -18,7 +18,7 @@ of asyncio and supports the following state machine characteristics:
 
 import logging
 import asyncio
-from typing import Callable, Optional, Awaitable, TypeVar, Type, Any, List, Set, Generic, Union
+from typing import Callable, Dict, Optional, Awaitable, TypeVar, Type, Any, List, Set, Generic, Tuple, Union
 
 logger = logging.getLogger("StateMachine")
 logger.setLevel(logging.WARNING)
@@ -29,16 +29,18 @@ handler.setFormatter(logging.Formatter("%(message)s"))
 handler.setLevel(logging.DEBUG)
 plantuml_logger.addHandler(handler)
 
-ActiveStates = List[Union["State", Set["State"]]]
-
-_POLL_INTERVAL_S = 0.05
-"""Interval for checking event status.
-Too short will increase CPU use.
-Too long will increase latency.
-"""
+ActiveStates = List[Union["State", "_ConcurrentStates"]]
 
 T = TypeVar("T")
 
+TransitionFunction = Callable[[], Optional[Awaitable[None]]]
+"""A transition function, called on each tick for the active state.
+
+It either awaits its transition itself (an `async def`) or, for an unconditional transition, simply returns
+the awaitable from :py:meth:`CompositeState._transition_to`, saving a coroutine frame per transition.
+A plain function may also return `None` when no transition is due.
+"""
+
 
 # MARK: State
 class State:
@@ -50,12 +52,41 @@ class State:
         A client is prevented from instantiating this class directly.  Rather, it must be sub-classed to create
         an application-specific :py:class:`State`.
 
+        The framework classes declare `__slots__` for their own attributes; a client sub-class that does not
+        declare any still has a `__dict__`, so its actions may be replaced per instance (as the tests do).
+
     Attributes:
-        _super_state:      the super-state of this one, either a composite state or the top-level
-                           state machine - optional for the case where :py:class:`State` is a
-                           base state of a :py:class:`StateMachine` (which has no :py:attr:`super_state`)
+        _super_state:         the super-state of this one, either a composite state or the top-level
+                              state machine - optional for the case where :py:class:`State` is a
+                              base state of a :py:class:`StateMachine` (which has no :py:attr:`super_state`)
+        _state_machine:       the top-level state machine this state belongs to, found once on construction - None
+                              if this state has no super-state and is not itself a :py:class:`StateMachine`
+        _name:                the name of this state - its class name, unless set otherwise through :py:attr:`name`
+        _display_name:        the name returned by :py:meth:`__str__`, formed on construction and on each rename
+        _hash:                the hash of :py:attr:`_display_name`, returned by :py:meth:`__hash__`
+        _super_is_concurrent: whether :py:attr:`_super_state` is a :py:class:`ConcurrentCompositeState`
+        _IS_PSEUDO:           whether this is an initial, final or history pseudo-state, which has no actions
+        _IS_FINAL:            whether this is a final pseudo-state, which is never activated
+        _transition:          the function managing the transitions from this state, as set by its super-state's
+                              :py:meth:`BaseCompositeState._set_transitions_per_state` - None if there are none
+        _needs_do:            whether the ticker needs to call :py:meth:`do`, as found by :py:meth:`_has_do` on each
+                              activation - it does not for a simple state with no :py:meth:`do_actions`
     """
 
+    __slots__ = (
+        "_super_state",
+        "_state_machine",
+        "_name",
+        "_display_name",
+        "_hash",
+        "_super_is_concurrent",
+        "_transition",
+        "_needs_do",
+    )
+
+    _IS_PSEUDO = False
+    _IS_FINAL = False
+
     def __init__(self, super_state: Optional["BaseCompositeState"] = None) -> None:
         """Creates a state.
 
@@ -65,7 +96,21 @@ class State:
             super_state: The super composite state of this one if it exists
         """
         self._super_state: BaseCompositeState | None = super_state
-        self.name = self.__class__.__name__
+        self._state_machine: StateMachine | None = (
+            self
+            if isinstance(self, StateMachine)
+            else super_state._state_machine if super_state is not None else None
+        )
+        self._super_is_concurrent = isinstance(super_state, ConcurrentCompositeState)
+        self._transition: TransitionFunction | None = None
+        self._needs_do = False
+        self._name = name = self.__class__.__name__
+        self._set_display_name(name[1:] if name[0] == "_" else name)
+
+    def _set_display_name(self, display_name: str) -> None:
+        """Sets the name returned by :py:meth:`__str__`, along with the hash derived from it."""
+        self._display_name = display_name
+        self._hash = hash(display_name)
 
     def __str__(self) -> str:
         """Gets the name of this state (its class name).
@@ -73,50 +118,99 @@ class State:
         Returns:
             state name
         """
-        return self.name[1:] if self.name[0] == "_" else self.name
+        return self._display_name
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return self._hash
+
+    def _refresh_display_name(self) -> None:
+        """Re-forms the name returned by :py:meth:`__str__` from :py:attr:`name`, after a rename."""
+        name = self._name
+        self._set_display_name(name[1:] if name[0] == "_" else name)
+
+    @property
+    def name(self) -> str:
+        """The name of this state - its class name, unless set otherwise."""
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        """Renames this state, keeping :py:meth:`__str__` and :py:meth:`__hash__` in step."""
+        self._name = name
+        self._refresh_display_name()
 
     @property
     def state_machine(self) -> "StateMachine":
-        if isinstance(self, StateMachine):
-            return self
-        else:
-            assert self._super_state is not None
-            return self._super_state.state_machine
+        assert self._state_machine is not None
+        return self._state_machine
+
+    def _overrides(self, name: str) -> bool:
+        """Whether the named action has been overridden - by a sub-class, or on this instance - from the no-op.
+
+        Args:
+            name: the name of the action method, e.g. `do_actions`
+        """
+        return getattr(type(self), name) is not getattr(State, name) or name in getattr(self, "__dict__", ())
+
+    def _has_do(self) -> bool:
+        """Whether there is anything for :py:meth:`do` to do on each tick - any do actions, an overridden
+        :py:meth:`do` or PlantUML logging."""
+        return self._overrides("do_actions") or self._overrides("do") or plantuml_logger.isEnabledFor(logging.DEBUG)
 
     def activate(self) -> None:
         """Adds the state to the stack of *active* states.
 
         Adds the state to the stack of *active* states to have their :py:meth:`do` methods executed.
         """
-        self.state_machine.active_states.append(self)
-        logger.debug("%s activated: %s", str(self), str(self.state_machine.active_state_types))
+        self._needs_do = self._has_do()
+        state_machine = self.state_machine
+        state_machine.active_states.append(self)
+        state_machine._active_state_types = None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s activated: %s", self, state_machine.active_state_types)
 
     def deactivate(self) -> None:
         """Stops the state executing within its :py:meth:`_do_task`."""
-        self.state_machine.active_states.pop()
-        logger.debug("%s deactivated: %s", str(self), str(self.state_machine.active_state_types))
+        state_machine = self.state_machine
+        state_machine.active_states.pop()
+        state_machine._active_state_types = None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s deactivated: %s", self, state_machine.active_state_types)
 
     def activate_concurrent_state(self) -> None:
         """Starts the state executing within its :py:meth:`_do_task`."""
-        if not isinstance(self.state_machine.active_states[-1], set):
-            self.state_machine.active_states.append(set())
+        self._needs_do = self._has_do()
+        state_machine = self.state_machine
+        active_states = state_machine.active_states
 
-        assert isinstance(self.state_machine.active_states[-1], set)
-        self.state_machine.active_states[-1].add(self)
-        logger.debug("%s activated: %s", str(self), str(self.state_machine.active_state_types))
+        if not isinstance(active_states[-1], _ConcurrentStates):
+            active_states.append(_ConcurrentStates())
+
+        concurrent_states = active_states[-1]
+        assert isinstance(concurrent_states, _ConcurrentStates)
+        concurrent_states.states.add(self)
+        state_machine._active_state_types = None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s activated: %s", self, state_machine.active_state_types)
 
     def deactivate_concurrent_state(self) -> None:
         """Stops the state executing within its :py:meth:`_do_task`."""
-        assert isinstance(self.state_machine.active_states[-1], set)
-        self.state_machine.active_states[-1].remove(self)
+        state_machine = self.state_machine
+        active_states = state_machine.active_states
+        concurrent_states = active_states[-1]
+        assert isinstance(concurrent_states, _ConcurrentStates)
+        concurrent_states.states.remove(self)
 
-        if not self.state_machine.active_states[-1]:
-            self.state_machine.active_states.pop()
+        if not concurrent_states.states:
+            active_states.pop()
 
-        logger.debug("%s deactivated: %s", str(self), str(self.state_machine.active_state_types))
+        state_machine._active_state_types = None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s deactivated: %s", self, state_machine.active_state_types)
 
     async def transition(self, new_state: "State", *actions: Callable[[], Awaitable[None]]) -> "State":
         """Manages a transition from this, current state to the specified new state.
@@ -136,16 +230,17 @@ class State:
             the specified `new_state`
         """
         await self.exit()
-        logger.info("%s -> %s", str(self), str(new_state))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s -> %s", self, new_state)
 
         for action in actions:
             await action()
 
-        if not isinstance(new_state, (_InitialState, _FinalState, _BaseHistoryState)):
+        if not new_state._IS_PSEUDO:
             await new_state.entry()
 
-        if not isinstance(new_state, _FinalState):
-            if isinstance(self._super_state, ConcurrentCompositeState):
+        if not new_state._IS_FINAL:
+            if self._super_is_concurrent:
                 new_state.activate_concurrent_state()
             else:
                 new_state.activate()
@@ -154,13 +249,17 @@ class State:
 
     async def entry(self) -> None:
         """Generates PlantUML log messages and runs any entry behaviour for this state."""
-        plantuml_logger.debug("activate %s", str(self))
-        plantuml_logger.debug("%s -> %s : entry()", str(self), str(self))
+        if plantuml_logger.isEnabledFor(logging.DEBUG):
+            plantuml_logger.debug("activate %s", self)
+            plantuml_logger.debug("%s -> %s : entry()", self, self)
+
         await self.entry_actions()
 
     async def do(self) -> None:
         """Generates a PlantUML log message then runs any :py:meth:`_do` behaviour until deactivated."""
-        plantuml_logger.debug("%s -> %s : do()", str(self), str(self))
+        if plantuml_logger.isEnabledFor(logging.DEBUG):
+            plantuml_logger.debug("%s -> %s : do()", self, self)
+
         await self.do_actions()
 
     async def exit(self) -> None:
@@ -177,26 +276,32 @@ class State:
                 All State and CompositeState instances must have a 'super' state, all the way up
                 to a top-level StateMachine instance
         """
-        if not isinstance(self, (_InitialState, _FinalState, _BaseHistoryState)):
-            plantuml_logger.debug("%s -> %s : exit()", str(self), str(self))
+        if not self._IS_PSEUDO:
+            if plantuml_logger.isEnabledFor(logging.DEBUG):
+                plantuml_logger.debug("%s -> %s : exit()", self, self)
+
             await self.exit_actions()
             assert self._super_state is not None, "super state is None"
 
-            if isinstance(self._super_state, ConcurrentCompositeState):
+            state_machine = self.state_machine
+            top_of_stack = state_machine.active_states[-1]
+
+            if self._super_is_concurrent:
                 assert isinstance(
-                    self.state_machine.active_states[-1], set
+                    top_of_stack, _ConcurrentStates
                 ), "the top of the stack should be a set of concurrent states"
                 assert (
-                    self in self.state_machine.active_states[-1]
-                ), f"{str(self)} is not at top of stack {self.state_machine.active_state_types}"
+                    self in top_of_stack.states
+                ), f"{str(self)} is not at top of stack {state_machine.active_state_types}"
                 self.deactivate_concurrent_state()
             else:
                 assert (
-                    self == self.state_machine.active_states[-1]
-                ), f"{str(self)} is not at top of stack {self.state_machine.active_state_types}"
+                    self == top_of_stack
+                ), f"{str(self)} is not at top of stack {state_machine.active_state_types}"
                 self.deactivate()
 
-            plantuml_logger.debug("deactivate %s", str(self))
+            if plantuml_logger.isEnabledFor(logging.DEBUG):
+                plantuml_logger.debug("deactivate %s", self)
 
     async def entry_actions(self) -> None:
         """For the client to override if the sub-classed state has 'entry' actions."""
@@ -217,22 +322,33 @@ class State:
 class _InitialState(State):
     """Initial pseudo state."""
 
+    __slots__ = ()
+
+    _IS_PSEUDO = True
+
     def __init__(self, super_state: "BaseCompositeState") -> None:
         super().__init__(super_state)
+        self._refresh_display_name()
 
-    def __str__(self) -> str:
-        return str(self._super_state) + "_initial"
+    def _refresh_display_name(self) -> None:
+        self._set_display_name(str(self._super_state) + "_initial")
 
 
 # MARK: _FinalState(State)
 class _FinalState(State):
     """Final pseudo state."""
 
+    __slots__ = ()
+
+    _IS_PSEUDO = True
+    _IS_FINAL = True
+
     def __init__(self, super_state: "BaseCompositeState") -> None:
         super().__init__(super_state)
+        self._refresh_display_name()
 
-    def __str__(self) -> str:
-        return str(self._super_state) + "_final"
+    def _refresh_display_name(self) -> None:
+        self._set_display_name(str(self._super_state) + "_final")
 
 
 # MARK: _BaseHistoryState(State)
@@ -244,8 +360,16 @@ class _BaseHistoryState(State):
                              at the time of transition away from the :py:class:`CompositeState`
     """
 
-    def __str__(self) -> str:
-        return str(self._super_state) + "_history"
+    __slots__ = ()
+
+    _IS_PSEUDO = True
+
+    def __init__(self, super_state: "BaseCompositeState") -> None:
+        super().__init__(super_state)
+        self._refresh_display_name()
+
+    def _refresh_display_name(self) -> None:
+        self._set_display_name(str(self._super_state) + "_history")
 
 
 # MARK: _HistoryState(_BaseHistoryState)
@@ -257,6 +381,8 @@ class _HistoryState(_BaseHistoryState):
                              at the time of transition away from the :py:class:`CompositeState`
     """
 
+    __slots__ = ("state_to_return_to",)
+
     def __init__(self, super_state: "CompositeState") -> None:
         """Creates a `HistoryState`.
 
@@ -279,6 +405,8 @@ class _ConcurrentHistoryState(_BaseHistoryState):
                              at the time of transition away from the :py:class:`CompositeState`
     """
 
+    __slots__ = ("states_to_return_to",)
+
     def __init__(self, super_state: "ConcurrentCompositeState", concurrent_state_count: int) -> None:
         """Creates a `HistoryState`.
 
@@ -312,10 +440,14 @@ class BaseCompositeState(State):
         _initial:               the entry point if there is no history active
         _final:                 the exit point if the state exits under its control, rather than being forced to exit
                                 by its super state
-        _transitions_per_state: a map of async functions per state to manage the transition from that state
-                                - intended to be updated by the subclass of this class
+        _TRANSITIONS:           the transition table of the subclass, as (state attribute name, transition function
+                                name) pairs, bound by :py:meth:`_set_transitions_per_state` once the sub-states exist
     """
 
+    __slots__ = ("_initial", "_final")
+
+    _TRANSITIONS: tuple[tuple[str, str], ...] = ()
+
     def __init__(self, super_state: Optional["CompositeState"] = None) -> None:
         """Instantiates a composite state.
 
@@ -328,13 +460,43 @@ class BaseCompositeState(State):
         super().__init__(super_state)
         self._initial = _InitialState(self)
         self._final = _FinalState(self)
-        self._transitions_per_state: dict[State, Callable[[], Awaitable[None]]] = {}
+
+    def _refresh_display_name(self) -> None:
+        """Also re-forms the names of the pseudo-states, which are derived from this state's."""
+        super()._refresh_display_name()
+        self._initial._refresh_display_name()
+        self._final._refresh_display_name()
+        history = getattr(self, "_history", None)
+
+        if history is not None:
+            history._refresh_display_name()
+
+    def _has_do(self) -> bool:
+        """Always true, as :py:meth:`do` also manages the transitions from the active sub-state(s)."""
+        return True
 
     def _create_child(self, child_state_type: Type[S], *args: Any) -> S:
         return child_state_type(self, *args)  # type: ignore
 
-    def _set_transitions_per_state(self, transitions_per_state: dict[State, Callable[[], Awaitable[None]]]) -> None:
-        self._transitions_per_state.update(transitions_per_state)
+    def _set_transitions_per_state(
+        self, transitions_per_state: Optional[dict[State, TransitionFunction]] = None
+    ) -> None:
+        """Sets the transition function for each sub-state.
+
+        Each function is stored on its sub-state, so finding the transitions from the active state on each tick needs
+        no lookup.
+
+        Args:
+            transitions_per_state: the transition function per sub-state - if omitted, it is bound from the
+                                   class's :py:attr:`_TRANSITIONS` table
+        """
+        if transitions_per_state is None:
+            transitions_per_state = {
+                getattr(self, state): getattr(self, function) for state, function in self._TRANSITIONS
+            }
+
+        for state, transition_function in transitions_per_state.items():
+            state._transition = transition_function
 
 
 # MARK: CompositeState(BaseCompositeState)
@@ -355,10 +517,10 @@ class CompositeState(BaseCompositeState):
                                 by its super state
         _states:                the currently active sub state(s)
         _history:               the state to return to if this composite state keeps a history
-        _transitions_per_state: a map of async functions per state to manage the transition from that state
-                                - intended to be updated by the subclass of this class
     """
 
+    __slots__ = ("_history", "_state")
+
     def __init__(
         self,
         super_state: Optional["CompositeState"] = None,
@@ -387,8 +549,8 @@ class CompositeState(BaseCompositeState):
         """
         self._state = await self._state.transition(new_state, *actions)
 
-        if isinstance(self._state, _FinalState):
-            await self.state_machine.trigger_tick()
+        if self._state._IS_FINAL:
+            self.state_machine._request_tick()
 
     async def _handle_history(self) -> None:
         """Manages a transition target per whether the composite state has an active history.
@@ -398,14 +560,17 @@ class CompositeState(BaseCompositeState):
         """
         assert self._history is not None
         assert (target_state := self._history.state_to_return_to) is not None
-        logger.debug("history target state = %s", str(target_state))
+        logger.debug("history target state = %s", target_state)
         await self._transition_to(target_state)
         self._history.state_to_return_to = None
 
     async def do(self) -> None:
         """Manages :py:meth:`_do` behaviour and internal transitions."""
         await self.do_actions()
-        plantuml_logger.debug("%s -> %s : do()", str(self), str(self))
+
+        if plantuml_logger.isEnabledFor(logging.DEBUG):
+            plantuml_logger.debug("%s -> %s : do()", self, self)
+
         await self._transitions()
 
     async def exit(self) -> None:
@@ -434,22 +599,23 @@ class CompositeState(BaseCompositeState):
     async def _transitions(self) -> None:
         """Finds and executes the transition function for each active state.
 
-        Note: If the active state is the initial or history (of which there is only one per composite state),
-        then the transitions to each concurrent state should be specified by the subclass.
+        Note: An unconditional transition need not be a coroutine itself; it can return the awaitable from
+        :py:meth:`_transition_to` directly.
 
         For example:
 
-            async def _initial_transitions(self) -> None:
-                await self._transition_to(self._state_1, 0)
-                await self._transition_to(self._state_3, 1)
+            def _initial_transitions(self) -> Awaitable[None]:
+                return self._transition_to(self._state_1)
 
-            async def _history_transitions(self) -> None:
-                await self._handle_history(0)
-                await self._handle_history(1)
+            async def _state_1_transitions(self) -> None:
+                if self._event():
+                    await self._transition_to(self._state_2)
         """
-        transition_function: Optional[Callable[[], Awaitable[None]]] = self._transitions_per_state.get(self._state)
+        transition_function = self._state._transition
         if transition_function is not None:
-            await transition_function()
+            transition = transition_function()
+            if transition is not None:
+                await transition
 
 
 # MARK: ConcurrentCompositeState(BaseCompositeState)
@@ -470,10 +636,10 @@ class ConcurrentCompositeState(BaseCompositeState):
                                 by its super state
         _states:                the currently active sub state(s)
         _history:               the state to return to if this composite state keeps a history
-        _transitions_per_state: a map of async functions per state to manage the transition from that state
-                                - intended to be updated by the subclass of this class
     """
 
+    __slots__ = ("_history", "_states")
+
     def __init__(
         self,
         concurrent_state_count: int,
@@ -509,6 +675,42 @@ class ConcurrentCompositeState(BaseCompositeState):
         """
         self._states[state_index] = await self._states[state_index].transition(new_state, *actions)
 
+        if self.is_at_final_state():
+            self.state_machine._request_tick()
+
+    async def _transition_many_to(self, *transitions: Tuple[Any, ...]) -> None:
+        """Manages transitions in several concurrent regions at once, running them concurrently.
+
+        Preferred over a sequence of :py:meth:`_transition_to` calls when several regions transition together, such
+        as on leaving the initial state - e.g.
+        `await self._transition_many_to((self._state_1, 0), (self._state_3, 1))`.
+
+        Args:
+            transitions: a `(new_state, state_index, *actions)` tuple per region, as for :py:meth:`_transition_to`
+
+        Raises:
+            Exception: the first raised by any region's transition - once all the regions have finished, and
+                       those that completed have been recorded in :py:attr:`_states`
+        """
+        states = self._states
+        results = await asyncio.gather(
+            *(states[state_index].transition(new_state, *actions) for new_state, state_index, *actions in transitions),
+            return_exceptions=True,
+        )
+        error: BaseException | None = None
+
+        for transition, result in zip(transitions, results):
+            if isinstance(result, BaseException):
+                error = error or result
+            else:
+                states[transition[1]] = result
+
+        if error is not None:
+            raise error
+
+        if self.is_at_final_state():
+            self.state_machine._request_tick()
+
     async def _handle_history(self, concurrent_state_index: int) -> None:
         """Manages a transition target per whether the composite state has an active history.
 
@@ -523,7 +725,10 @@ class ConcurrentCompositeState(BaseCompositeState):
     async def do(self) -> None:
         """Manages :py:meth:`_do` behaviour and internal transitions."""
         await self.do_actions()
-        plantuml_logger.debug("%s -> %s : do()", str(self), str(self))
+
+        if plantuml_logger.isEnabledFor(logging.DEBUG):
+            plantuml_logger.debug("%s -> %s : do()", self, self)
+
         await self._transitions()
 
     async def exit(self) -> None:
@@ -531,16 +736,20 @@ class ConcurrentCompositeState(BaseCompositeState):
 
         Also clears any pending was_polled event that occurred while the final state was active.
         """
-        for state in self._states:
+        states = self._states
+        final = self._final
+        at_final_state = True
+
+        for state in states:
             await state.exit()
+            if state is not final:
+                at_final_state = False
 
-        if self._history is not None and any(state != self._final for state in self._states):
-            for i, state in enumerate(self._states):
-                self._history.states_to_return_to[i] = state
-                self._states[i] = self._history
+        if self._history is not None and not at_final_state:
+            self._history.states_to_return_to[:] = states
+            states[:] = [self._history] * len(states)
         else:
-            for i, state in enumerate(self._states):
-                self._states[i] = self._initial
+            states[:] = [self._initial] * len(states)
 
         await super().exit()
 
@@ -550,7 +759,11 @@ class ConcurrentCompositeState(BaseCompositeState):
         Returns:
             bool: whether at the final state
         """
-        return all(state == self._final for state in self._states)
+        final = self._final
+        for state in self._states:
+            if state is not final:
+                return False
+        return True
 
     async def _transitions(self) -> None:
         """Finds and executes the transition function for each active state.
@@ -560,24 +773,58 @@ class ConcurrentCompositeState(BaseCompositeState):
 
         For example:
 
-            async def _initial_transitions(self) -> None:
-                await self._transition_to(self._state_1, 0)
-                await self._transition_to(self._state_3, 1)
+            def _initial_transitions(self) -> Awaitable[None]:
+                return self._transition_many_to((self._state_1, 0), (self._state_3, 1))
 
             async def _history_transitions(self) -> None:
                 await self._handle_history(0)
                 await self._handle_history(1)
         """
-        transition_functions: list[Optional[Callable[[], Awaitable[None]]]] = (
-            [self._transitions_per_state.get(state) for state in self._states]
-            if self._states[0] not in (self._initial, self._history)
-            else [self._transitions_per_state.get(self._states[0])]
-        )
+        states: list[State] = self._states
+        first_state = states[0]
+
+        # All the regions share the initial or history state, and its single transition function covers them all
+        if first_state is self._initial or first_state is self._history:
+            states = [first_state]
+
+        transitions: list[Awaitable[None]] = []
+        for state in states:
+            transition_function = state._transition
+            if transition_function is not None:
+                transition = transition_function()
+                if transition is not None:
+                    transitions.append(transition)
+
+        # A lone transition is awaited directly, as gathering it would cost a task and a trip round the event loop
+        if len(transitions) == 1:
+            await transitions[0]
+        elif transitions:
+            await asyncio.gather(*transitions)
+
 
-        transitions: list[Awaitable[None]] = [
-            transition_function() for transition_function in transition_functions if transition_function is not None
-        ]
-        await asyncio.gather(*transitions)
+# MARK: _ConcurrentStates
+class _ConcurrentStates:
+    """The active states of the concurrent regions of a :py:class:`ConcurrentCompositeState`.
+
+    Occupies a single entry of :py:attr:`StateMachine.active_states`, and ticks like a :py:class:`State` does, so
+    the ticker can call :py:meth:`do` on every entry without checking what it holds.
+
+    Attributes:
+        states: the active state of each concurrent region
+    """
+
+    __slots__ = ("states",)
+
+    _needs_do = True
+
+    def __init__(self) -> None:
+        self.states: Set[State] = set()
+
+    async def do(self) -> None:
+        """Runs :py:meth:`State.do` for each of the concurrent states that needs it, in turn."""
+        for state in self.states:
+            if state._needs_do:
+                await state.do()
 
 
 # MARK: StateMachine(CompositeState)
@@ -591,27 +838,49 @@ class StateMachine(CompositeState):
         an application-specific :py:class:`StateMachine`.
 
     Attributes:
-        active_states: for tracking the active state (or states if there are concurrent
-                       or composite states) in this state machine
+        active_states:       for tracking the active state (or states if there are concurrent
+                             or composite states) in this state machine
+        _active_state_types: the names of the active states, as last built by :py:attr:`active_state_types` -
+                             None whenever :py:attr:`active_states` has changed since
+        _settled:            set whenever the ticker is idle, with no tick in progress or pending, or has exited
+        ticker:              the ticker task, as created by :py:meth:`start` - None until then
+        _ticker_stopped:     clear only while the ticker is running - set before it first runs and once it exits
     """
 
+    __slots__ = ("_tick_event", "active_states", "_active_state_types", "_settled", "ticker", "_ticker_stopped")
+
     def __init__(self) -> None:
         """Creates a `StateMachine`."""
         super().__init__()
         self._tick_event = asyncio.Event()
         self.active_states: ActiveStates = []
+        self._active_state_types: Tuple[str | Tuple[str, ...], ...] | None = None
+        self._settled = asyncio.Event()
+        self._settled.set()
+        self.ticker: asyncio.Task[None] | None = None
+        self._ticker_stopped = asyncio.Event()
+        self._ticker_stopped.set()
 
     @property
-    def active_state_types(self) -> List[str | List[str]]:  # type: ignore
+    def active_state_types(self) -> Tuple[str | Tuple[str, ...], ...]:  # type: ignore
         """Gets all the currently active states.
 
+        The names are only rebuilt after the active states have changed; until then the same tuple is returned.
+
         Returns:
-            the set of active states
+            the names of the active states, with the states of a concurrent region as a sorted tuple
         """
-        return [
-            (sorted(list(str(state) for state in item)) if isinstance(item, set) else str(item))
-            for item in self.active_states
-        ][1:]
+        if self._active_state_types is None:
+            self._active_state_types = tuple(
+                (
+                    tuple(sorted(str(state) for state in item.states))
+                    if isinstance(item, _ConcurrentStates)
+                    else str(item)
+                )
+                for item in self.active_states[1:]
+            )
+
+        return self._active_state_types
 
     async def trigger_tick(self):
         """To trigger the state machine to detect an event.
@@ -619,55 +888,131 @@ class StateMachine(CompositeState):
         The asyncio.sleep() appears to be required to tick over the event loop
         in micropython.
         """
-        self._tick_event.set()
+        self._request_tick()
         await asyncio.sleep(0)
 
+    def _request_tick(self) -> None:
+        """Requests another tick without yielding.
+
+        For use from within a tick: the ticker runs the requested tick as soon as the current one completes, so
+        there is no need to yield to it.  Does nothing if a tick is already pending.
+        """
+        if not self._tick_event.is_set():
+            self._settled.clear()
+            self._tick_event.set()
+
+    async def settle(self) -> None:
+        """Waits until the state machine has finished processing all pending transitions.
+
+        That is, until the ticker is neither part way through a tick nor has another tick pending, such as
+        one triggered by a composite state reaching its final state during the last tick.  Returns at once if the
+        ticker has exited, as then nothing is left to process.
+
+        Raises:
+            Exception: whatever the ticker exited with, if a tick raised
+        """
+        ticker = self.ticker
+
+        if ticker is None or not ticker.done():
+            await self._settled.wait()
+
+            if ticker is None or not ticker.done():
+                return
+
+        await self._ticker_outcome()
+
+    async def _ticker_outcome(self) -> None:
+        """Re-raises whatever the ticker, which must have exited, raised - if anything."""
+        try:
+            await self.ticker  # already done, so this returns or raises at once
+        except asyncio.CancelledError:
+            pass  # cancelled before it ever ran
+
     def clear_active_states(self) -> None:
         """Gets all the currently active states."""
         self.active_states.clear()
+        self._active_state_types = None
+
+    def install_test_hooks(self, hooks: Dict[Tuple[str, ...], Callable[..., Any]]) -> None:
+        """Replaces attributes of this state machine, or of its nested states, in one call.
+
+        Intended for tests, to substitute mocks for actions and guards before the state machine is started.  The
+        hooks are assigned directly, so there is no cost when the actions are later called.
+
+        Args:
+            hooks: a map of attribute paths, relative to this state machine, to their replacements - e.g.
+                   ``("_state_1", "_state_2", "entry_actions")`` for ``self._state_1._state_2.entry_actions``
+        """
+        for path, hook in hooks.items():
+            parent = self
+            for attribute in path[:-1]:
+                parent = getattr(parent, attribute)
+            setattr(parent, path[-1], hook)
 
     async def start(self):
         """Starts the state machine.
 
         Starts the state machine by performing the following:
           1. Adding the state machine to the list of active states
-          2. Creating the ticker task
-          3. Yielding to allow the ticker task to run through once to process the initial transition.
+          2. Setting the tick event and creating the ticker task
+          3. Awaiting :py:meth:`settle`, so the initial transition - and any ticks it requests - have been processed,
+             even if entry actions suspend.
         """
 
         async def ticker() -> None:
-            """Executes a tick then awaits the next tick event, exiting when cancelled."""
+            """Awaits each tick event then executes a tick, exiting when cancelled."""
 
             async def tick():
                 """Executes each of the active state `do` methods"""
-                logger.debug("Tick...")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Tick...")
+
                 for item in self.active_states:
-                    if isinstance(item, set):
-                        for state in item:
-                            await state.do()
-                    else:
+                    if item._needs_do:
                         await item.do()
 
+            self._ticker_stopped.clear()
+
             try:
                 while True:
-                    await tick()
                     await self._tick_event.wait()
                     self._tick_event.clear()
+
+                    try:
+                        await tick()
+                    finally:
+                        if not self._tick_event.is_set():
+                            self._settled.set()
             except asyncio.CancelledError:
                 logger.debug("Ticker stopped")
+            finally:
+                # However the ticker exits - even with a tick raising while another is pending - nothing is left
+                # to process, so anything awaiting settle() must be released
+                self._settled.set()
+                self._ticker_stopped.set()
 
         self.activate()
-        self.ticker: asyncio.Task[None] = asyncio.create_task(ticker())
+        self._settled.clear()
+        self._tick_event.set()
+        self.ticker = asyncio.create_task(ticker())
         logger.debug("Ticker started")
-        await asyncio.sleep(_POLL_INTERVAL_S)
+        await self.settle()
         return self.ticker
 
     async def stop_ticker(self, stopped_event: asyncio.Event | None = None) -> None:
-        """Stops the state machine by cancelling the ticker task."""
+        """Stops the state machine by cancelling the ticker task, then awaiting its completion."""
+        assert self.ticker is not None
         self.ticker.cancel()
 
-        while not self.ticker.done():
-            await asyncio.sleep(_POLL_INTERVAL_S)
+        try:
+            # Waits on the ticker's event rather than the ticker itself - cancelling a caller awaiting the ticker
+            # would pass the cancellation on to the ticker, which handles it, so it would never reach the caller
+            await self._ticker_stopped.wait()
+        finally:
+            self._settled.set()  # for a ticker cancelled before it ever ran, so never set it itself
+
+        if self.ticker.done():
+            await self._ticker_outcome()
 
         if stopped_event:
             stopped_event.set()
@@ -675,13 +1020,19 @@ class StateMachine(CompositeState):
 
 # MARK: Event
 class Event:
-    """An event with an associated name."""
+    """An event with an associated name.
+
+    The event is a plain flag, polled by transition functions, rather than an :py:class:`asyncio.Event`
+    as nothing awaits it directly - setting it triggers a tick of the state machine instead.
+    """
+
+    __slots__ = ("_state_machine", "_name", "_is_set")
 
     def __init__(self, state_machine: StateMachine, name: str = "event") -> None:
         super().__init__()
         self._state_machine = state_machine
         self._name = name
-        self._event = asyncio.Event()
+        self._is_set = False
 
     def __call__(self) -> bool:
         """Automatically clears the event if set.
@@ -689,27 +1040,51 @@ class Event:
         Returns:
             whether the event was set
         """
-        if self._event.is_set():
-            self.clear()
-            return True
-        else:
+        if not self._is_set:
             return False
 
+        # As clear(), inlined as the event is polled on every tick
+        self._is_set = False
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Event %s cleared", self._name)
+
+        return True
+
     async def set(self) -> None:
-        self._event.set()
-        logger.debug("Event %s set", self._name)
-        plantuml_logger.debug("rnote over Events: %s", self._name)
-        await self._state_machine.trigger_tick()
+        """Sets the event, then yields so the state machine can tick to process it."""
+        self.set_nowait()
+        await asyncio.sleep(0)
+
+    def set_nowait(self) -> None:
+        """Sets the event and requests a tick to process it, without yielding.
+
+        For use from synchronous code, or from actions - which run within a tick, so need not yield to the next one.
+        Several events set in a row this way are then all processed by the one tick.
+        """
+        self._is_set = True
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Event %s set", self._name)
+
+        if plantuml_logger.isEnabledFor(logging.DEBUG):
+            plantuml_logger.debug("rnote over Events: %s", self._name)
+
+        self._state_machine._request_tick()
 
     def clear(self) -> None:
-        self._event.clear()
-        logger.debug("Event %s cleared", self._name)
+        self._is_set = False
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Event %s cleared", self._name)
 
 
 # MARK: EventWithValue(Generic[T], Event)
 class EventWithValue(Generic[T], Event):
     """An event with an optionally attached value."""
 
+    __slots__ = ("_value",)
+
     def __init__(self, state_machine: StateMachine, name: str = "") -> None:
         super().__init__(state_machine, name)
         self._value = None